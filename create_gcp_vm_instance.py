@@ -1,8 +1,14 @@
+import concurrent.futures
 import datetime
 import os
+import random
+import re
+import threading
+from google.api_core import exceptions, extended_operation, retry
+from google.api_core.future import polling
 from google.cloud import compute_v1
 from google.oauth2 import service_account
-from typing import Union, List, Dict
+from typing import Any, Callable, Iterator, List, Dict, Optional, Set
 import time
 import logging
 import yaml
@@ -10,6 +16,44 @@ import json
 import sys
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing at most `calls` calls per `period` seconds, with
+    bursts of up to `calls` calls.
+    """
+
+    def __init__(self, calls: int, period: float):
+        """
+        Initialize the token bucket as full.
+
+        Args:
+            calls (int): Maximum number of calls per period (also the bucket capacity).
+            period (float): Length of the period in seconds.
+        """
+        self.capacity = calls
+        self.tokens = float(calls)
+        self.refill_rate = calls / period
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a token is available, then consume it.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.refill_rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_rate
+            time.sleep(wait)
+
+
 class AcquireGpu:
     """
     Class for allocating GPUs on Google Cloud Platform by scanning available zones for
@@ -20,6 +64,21 @@ class AcquireGpu:
         - https://cloud.google.com/compute/docs/gpus
     """
 
+    # Per-zone scan results are kept on disk between runs. Quota-based results are reused for
+    # ZONE_CACHE_TTL_SEC and the zone/GPU/machine type inventory for ZONE_INVENTORY_TTL_SEC
+    ZONE_CACHE_PATH = ".zone_cache.json"
+    ZONE_CACHE_TTL_SEC = 120
+    ZONE_INVENTORY_TTL_SEC = 3600
+
+    # Number of top-ranked zones to attempt VM creation in at the same time
+    SPECULATIVE_INSERTS = 3
+
+    # Operations take tens of seconds, so wait before the first poll and back off from there.
+    # Each poll is an operations.get call, which is retried with _api_retry on 429/503
+    OPERATION_POLL_DELAY = {"initial": 5.0, "maximum": 20.0, "multiplier": 1.5}
+    OPERATION_POLLING = polling.DEFAULT_POLLING.with_delay(**OPERATION_POLL_DELAY)
+    OPERATION_TIMEOUT_SEC = 300
+
     def __init__(
         self,
         project_id: str,
@@ -53,8 +112,153 @@ class AcquireGpu:
         self.disk_source_image = disk_source_image
         self.disk_size = disk_size
 
+        # API clients are created once and shared, since each sets up its own transport
+        self._instances_client = compute_v1.InstancesClient()
+        self._regions_client = compute_v1.RegionsClient()
+        self._zones_client = compute_v1.ZonesClient()
+        self._accel_client = compute_v1.AcceleratorTypesClient()
+        self._machines_client = compute_v1.MachineTypesClient()
+        self._projects_client = compute_v1.ProjectsClient()
+
+        # Throttle Compute API calls and back off on 429/503 responses. TooManyRequests also
+        # covers its ResourceExhausted subclass, i.e. exceeded rate quotas, which is intended
+        self._rate_limiter = RateLimiter(calls=100, period=60)
+        self._api_retry = retry.Retry(
+            predicate=retry.if_exception_type(
+                exceptions.TooManyRequests, exceptions.ServiceUnavailable
+            ),
+            initial=1.0,
+            maximum=32.0,
+            multiplier=2.0,
+            timeout=120.0,
+        )
+        # A 429 means the request was rejected outright, so it is safe to resend even when
+        # the call is not idempotent. A 503 may not have been, so those calls skip it
+        self._rate_limit_retry = self._api_retry.with_predicate(
+            retry.if_exception_type(exceptions.TooManyRequests)
+        )
+
+        # Region info (including quotas) cached per scan, keyed by region name
+        self._region_cache: Dict[str, compute_v1.Region] = {}
+
+        # Per-zone probe inputs and results, loaded from and saved to ZONE_CACHE_PATH
+        self._zone_cache: Optional[Dict] = None
+
+    def _call(self, fn: Callable, *args, idempotent: bool = True, **kwargs) -> Any:
+        """
+        Call a Compute API method under the rate limiter, retrying with exponential backoff
+        when GCP responds with 429 (TooManyRequests) or 503 (ServiceUnavailable).
+
+        Args:
+            fn (Callable): The client method to call.
+            *args: Positional arguments for the call.
+            idempotent (bool): Whether the call may be resent after a 503. Non-idempotent
+                calls (e.g. insert) are only retried on 429.
+            **kwargs: Keyword arguments for the call.
+
+        Returns:
+            Any: The result of the call.
+        """
+
+        def attempt():
+            self._rate_limiter.acquire()
+            return fn(*args, **kwargs)
+
+        api_retry = self._api_retry if idempotent else self._rate_limit_retry
+        return api_retry(attempt)()
+
+    def _list_pages(self, fn: Callable, request) -> Iterator:
+        """
+        Page through a Compute API list method, fetching every page through _call so each
+        page is rate-limited and retried (the client pagers fetch later pages on their own).
+
+        Args:
+            fn (Callable): The client list or aggregated_list method.
+            request: The list request; its page_token is advanced in place.
+
+        Yields:
+            The raw response of each page.
+        """
+        while True:
+            # Only the already fetched first page of each pager is consumed
+            page = next(iter(self._call(fn, request=request).pages))
+            yield page
+            if not page.next_page_token:
+                return
+            request.page_token = page.next_page_token
+
+    def _get_region(self, region: str) -> compute_v1.Region:
+        """
+        Fetch region info (including quotas), hitting the API at most once per region per scan.
+
+        Args:
+            region (str): The region name (e.g., "us-central1").
+
+        Returns:
+            compute_v1.Region: The region info.
+        """
+        if region not in self._region_cache:
+            quota_request = compute_v1.GetRegionRequest(project=self.project_id, region=region)
+            self._region_cache[region] = self._call(self._regions_client.get, request=quota_request)
+        return self._region_cache[region]
+
+    def get_quota_headroom(self, region: str) -> float:
+        """
+        Compute the remaining GPU/CPU quota in a region, i.e. the smaller of the two
+        'limit - usage' values.
+
+        Args:
+            region (str): The region name (e.g., "us-central1").
+
+        Returns:
+            float: The remaining quota, or 0 if either quota is missing.
+        """
+        headroom = {}
+        for quota in self._get_region(region).quotas:
+            if quota.metric in (self.gpu_quota_name, "CPUS"):
+                headroom[quota.metric] = quota.limit - quota.usage
+        if len(headroom) < 2:
+            return 0
+        return min(headroom.values())
+
+    def get_global_gpu_headroom(self) -> Optional[float]:
+        """
+        Compute the remaining project-wide GPU quota (GPUS_ALL_REGIONS), which every VM
+        counts against regardless of its region.
+
+        Returns:
+            Optional[float]: The remaining quota, or None if the project has no such quota.
+        """
+        project = self._call(self._projects_client.get, project=self.project_id)
+        for quota in project.quotas:
+            if quota.metric == "GPUS_ALL_REGIONS":
+                return quota.limit - quota.usage
+        return None
+
+    def get_viable_regions(self) -> Set[str]:
+        """
+        List all regions in a single request, caching their info, and determine which
+        regions have both GPU and CPU quota left.
+
+        Returns:
+            Set[str]: Names of regions with remaining GPU and CPU quota.
+        """
+        viable_regions = set()
+        regions_request = compute_v1.ListRegionsRequest(project=self.project_id)
+        for page in self._list_pages(self._regions_client.list, regions_request):
+            for region_info in page.items:
+                self._region_cache[region_info.name] = region_info
+                if self.get_quota_headroom(region_info.name) > 0:
+                    viable_regions.add(region_info.name)
+        return viable_regions
+
     def create_single_vm(
-        self, region: str, zone_name: str, instance_name: str, machine_type: str
+        self,
+        region: str,
+        zone_name: str,
+        instance_name: str,
+        machine_type: str,
+        abort: Optional[threading.Event] = None,
     ) -> Dict[str, str]:
         """
         Attempt to instantiate a single VM instance. Calls the method that constructs
@@ -65,57 +269,204 @@ class AcquireGpu:
             zone_name (str): The zone name (e.g., "us-central1-a").
             instance_name (str): The name for the new VM instance.
             machine_type (str): The machine type to use for the VM.
+            abort (Optional[threading.Event]): When set, the insert is skipped, or abandoned
+                without waiting for it if already sent. The caller then deletes the VM.
 
         Returns:
-            Dict[str, str]: Dictionary containing 'region', 'zone', 'instance_name', and 'gpu_reason'.
+            Dict[str, str]: Dictionary containing 'region', 'zone', 'instance_name',
+                'gpu_reason', and 'inserted'. 'gpu_reason' is 'SUCCESS', 'CANCELLED', 'QUOTA',
+                'NO_STOCK', 'UNAVAILABLE', 'NOT_FOUND', 'TIMEOUT', or the exception class name
+                for other errors. 'inserted' is whether the VM may exist, i.e. the insert was
+                accepted and its operation did not report a failure.
         """
+        abort = abort or threading.Event()
+        inserted = False
         try:
-            self.create_vm_request(region, zone_name, instance_name, machine_type)
-            logging.info(
-                f"\nSuccessfully instantiated {self.gpu_type} on {machine_type} "
-                f"as {instance_name} VM in {zone_name}\n"
-            )
-            status = "SUCCESS"
+            if abort.is_set():
+                status = "CANCELLED"
+            else:
+                operation = self.create_vm_request(region, zone_name, instance_name, machine_type)
+                inserted = True
+                if self._wait_for_operation(operation, abort):
+                    logging.info(
+                        f"\nSuccessfully instantiated {self.gpu_type} on {machine_type} "
+                        f"as {instance_name} VM in {zone_name}\n"
+                    )
+                    status = "SUCCESS"
+                else:
+                    status = "CANCELLED"
         except Exception as e:
-            logging.info(f"{self.gpu_type} failed: {e}\n")
-            status = str(e).split(":")[:1][0]
+            status = self.classify_create_error(e)
+            logging.info(f"{self.gpu_type} failed in {zone_name} ({status}): {e}\n")
+            # Only a failure reported by the operation means GCE gave up on the VM. Any other
+            # error while waiting (e.g. a timeout or a failed poll) leaves the insert running
+            if self._operation_errors(e):
+                inserted = False
 
         return {
             "region": region,
             "zone": zone_name,
             "instance_name": instance_name,
             "gpu_reason": status,
+            "inserted": inserted,
         }
 
-    def is_gpu_available(
-        self, zone_name: str, accelerator_client: compute_v1.AcceleratorTypesClient
+    def _wait_for_operation(
+        self, operation: extended_operation.ExtendedOperation, abort: threading.Event
     ) -> bool:
         """
-        Check if the specified GPU type is available in a particular zone.
+        Wait for an operation like ExtendedOperation.result does, but stop waiting as soon as
+        `abort` is set rather than polling until the operation finishes.
 
         Args:
-            zone_name (str): The zone to check.
-            accelerator_client (compute_v1.AcceleratorTypesClient): Client to list accelerator types.
+            operation (ExtendedOperation): The operation to wait for.
+            abort (threading.Event): Event that abandons the wait when set.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the operation does not finish within
+                OPERATION_TIMEOUT_SEC.
 
         Returns:
-            bool: True if the GPU type is available (and within quota), otherwise False.
+            bool: True if the operation finished successfully, False if the wait was abandoned.
+                Errors reported by the operation are raised.
         """
-        try:
-            # List all accelerator types available in this zone
-            gpu_request = compute_v1.ListAcceleratorTypesRequest(
-                project=self.project_id, zone=zone_name
-            )
-            gpu_response = list(accelerator_client.list(request=gpu_request))
-            gpu_exists = any(gpu.name == self.gpu_type for gpu in gpu_response)
-
-            if not gpu_exists:
+        deadline = time.monotonic() + self.OPERATION_TIMEOUT_SEC
+        for delay in retry.exponential_sleep_generator(**self.OPERATION_POLL_DELAY):
+            # Sleep until the next poll, waking up early once the wait is abandoned
+            if abort.wait(min(delay, max(0.0, deadline - time.monotonic()))):
                 return False
+            if operation.done(retry=self._api_retry):
+                # Already finished, so this only raises the operation's error, if any
+                operation.result()
+                return True
+            if time.monotonic() >= deadline:
+                raise concurrent.futures.TimeoutError(
+                    f"Operation did not finish within {self.OPERATION_TIMEOUT_SEC} seconds"
+                )
+
+    @staticmethod
+    def _operation_errors(e: Exception) -> List:
+        """
+        Extract the errors reported by a failed operation, which the client raises with the
+        Operation as the exception's response.
+
+        Args:
+            e (Exception): The error raised while creating a VM.
+
+        Returns:
+            List: The operation's errors, or an empty list if the error did not come from one.
+        """
+        operation_error = getattr(getattr(e, "response", None), "error", None)
+        return list(getattr(operation_error, "errors", None) or [])
+
+    def classify_create_error(self, e: Exception) -> str:
+        """
+        Map an error raised while creating a VM to a short status code. The REST transport
+        raises exceptions by HTTP status (e.g. a quota failure is a 403 Forbidden), so the
+        GCE error codes carried by the exception decide the status where present.
 
+        Args:
+            e (Exception): The error raised by create_vm_request.
+
+        Returns:
+            str: 'QUOTA' if the region's GPU or CPU quota was exceeded, 'OTHER_QUOTA' for any
+                other quota (e.g. the project-wide GPUS_ALL_REGIONS), 'NO_STOCK', 'UNAVAILABLE',
+                'NOT_FOUND', 'TIMEOUT', or the exception class name.
+        """
+        # Exhausted retries (inserts are only retried on 429) wrap the last underlying error
+        if isinstance(e, exceptions.RetryError) and e.cause is not None:
+            return self.classify_create_error(e.cause)
+        if isinstance(e, concurrent.futures.TimeoutError):
+            return "TIMEOUT"
+
+        # Failed operations carry error codes (e.g. QUOTA_EXCEEDED, ZONE_RESOURCE_POOL_EXHAUSTED)
+        # and rejected requests carry reasons (e.g. quotaExceeded)
+        codes = []
+        messages = [str(e)]
+        for error in self._operation_errors(e):
+            codes.append(error.code)
+            messages.append(error.message)
+        for error in getattr(e, "errors", None) or []:
+            if isinstance(error, dict):
+                codes.append(error.get("reason", ""))
+                messages.append(error.get("message", ""))
+        codes.append(getattr(e, "reason", None) or "")
+        codes = [code.upper() for code in codes if code]
+
+        if any("QUOTA" in code for code in codes):
+            # Messages name the quota, e.g. "Quota 'GPUS_ALL_REGIONS' exceeded". Only the
+            # region's own quotas rule out its other zones
+            quotas = set(re.findall(r"Quota '(\w+)' exceeded", " ".join(messages)))
+            return "QUOTA" if quotas & {self.gpu_quota_name, "CPUS"} else "OTHER_QUOTA"
+        if any("RESOURCE_POOL_EXHAUSTED" in code or "STOCKOUT" in code for code in codes):
+            return "NO_STOCK"
+        # A 503 without a stockout code is a transient outage, not a capacity failure
+        if isinstance(e, exceptions.ServiceUnavailable):
+            return "UNAVAILABLE"
+        if isinstance(e, exceptions.NotFound):
+            return "NOT_FOUND"
+        return type(e).__name__
+
+    def get_gpu_zones(self) -> Dict[str, bool]:
+        """
+        Fetch the project-wide accelerator inventory in a single aggregated request and
+        determine which zones offer the configured GPU type.
+
+        Returns:
+            Dict[str, bool]: Mapping of zone name to True for every zone offering the GPU type.
+        """
+        # Filter server-side so only the configured GPU type is paged back, instead of
+        # every accelerator type in every zone
+        gpu_request = compute_v1.AggregatedListAcceleratorTypesRequest(
+            project=self.project_id, filter=f'name = "{self.gpu_type}"'
+        )
+        gpu_zones = {}
+        for page in self._list_pages(self._accel_client.aggregated_list, gpu_request):
+            for scope, scoped_list in page.items.items():
+                # Scope keys are of the form "zones/us-central1-a"
+                if any(gpu.name == self.gpu_type for gpu in scoped_list.accelerator_types or []):
+                    gpu_zones[scope.split("/")[-1]] = True
+        return gpu_zones
+
+    def get_machine_zones(self) -> Dict[str, Set[str]]:
+        """
+        Fetch the project-wide machine type inventory in a single aggregated request and
+        determine which of the configured machine types each zone offers.
+
+        Returns:
+            Dict[str, Set[str]]: Mapping of zone name to the configured machine types it offers.
+        """
+        # Filter server-side to the configured machine types; unfiltered, this pages through
+        # hundreds of machine types in every zone
+        machine_names = "|".join(re.escape(machine_type) for machine_type in self.machine_types)
+        machine_request = compute_v1.AggregatedListMachineTypesRequest(
+            project=self.project_id, filter=f'name eq "({machine_names})"'
+        )
+        machine_zones = {}
+        for page in self._list_pages(self._machines_client.aggregated_list, machine_request):
+            for scope, scoped_list in page.items.items():
+                # Scope keys are of the form "zones/us-central1-a"
+                machine_zones.setdefault(scope.split("/")[-1], set()).update(
+                    machine.name
+                    for machine in scoped_list.machine_types or []
+                    if machine.name in self.machine_types
+                )
+        return machine_zones
+
+    def is_gpu_available(self, zone_name: str, region: str) -> bool:
+        """
+        Check if the region of a particular zone has GPU quota left for the specified GPU type.
+
+        Args:
+            zone_name (str): The zone to check.
+            region (str): The region derived from the zone (e.g., 'us-central1').
+
+        Returns:
+            bool: True if the GPU type is within quota, otherwise False.
+        """
+        try:
             # Check for GPU resource availability via region quota
-            quota_request = compute_v1.GetRegionRequest(
-                project=self.project_id, region="-".join(zone_name.split("-")[:-1])
-            )
-            region_info = compute_v1.RegionsClient().get(request=quota_request)
+            region_info = self._get_region(region)
 
             # Look for the specific GPU quota
             for quota in region_info.quotas:
@@ -129,7 +480,7 @@ class AcquireGpu:
             return False
 
     def is_machine_available(
-        self, zone_name: str, machine_types_client: compute_v1.MachineTypesClient
+        self, zone_name: str, region: str, zone_machine_types: Set[str]
     ) -> str:
         """
         Check if at least one machine type (from the configured list) is actually
@@ -137,23 +488,19 @@ class AcquireGpu:
 
         Args:
             zone_name (str): The zone to check for machine type availability.
-            machine_types_client (compute_v1.MachineTypesClient): Client to check machine types.
+            region (str): The region derived from the zone (e.g., 'us-central1').
+            zone_machine_types (Set[str]): Configured machine types offered in this zone.
 
         Returns:
             str: The first available machine type if found, otherwise None.
         """
         for machine_type in self.machine_types:
-            try:
-                machine_request = compute_v1.GetMachineTypeRequest(
-                    project=self.project_id, zone=zone_name, machine_type=machine_type
-                )
-                machine_types_client.get(request=machine_request)  # Will raise if not found
+            if machine_type not in zone_machine_types:
+                continue
 
+            try:
                 # Check CPU quota in this zone's region
-                quota_request = compute_v1.GetRegionRequest(
-                    project=self.project_id, region="-".join(zone_name.split("-")[:-1])
-                )
-                region_info = compute_v1.RegionsClient().get(request=quota_request)
+                region_info = self._get_region(region)
                 for quota in region_info.quotas:
                     # If CPU usage is within limit, consider machine as available
                     if (quota.metric == "CPUS") and (quota.usage < quota.limit):
@@ -168,117 +515,375 @@ class AcquireGpu:
 
         return None  # No machine available
 
-    def attempt_gpu_allocation(
-        self,
-        region: str,
-        zone,
-        machine_types_client: compute_v1.MachineTypesClient,
-        gpu_available: bool,
-    ) -> Union[bool, Dict[str, str]]:
+    def _probe_zone(
+        self, region: str, zone_name: str, gpu_offered: bool, zone_machine_types: Set[str]
+    ) -> Dict[str, str]:
         """
-        If a GPU is marked as available in the given zone, try to find a suitable machine type
-        and create a VM instance.
+        Check GPU quota and machine type availability in a zone without creating a VM.
 
         Args:
             region (str): The region derived from the zone (e.g., 'us-central1').
-            zone: The zone object from listing zones.
-            machine_types_client (compute_v1.MachineTypesClient): Client to check machine types.
-            gpu_available (bool): Indicates whether GPU type is available in this zone.
+            zone_name (str): The zone to check.
+            gpu_offered (bool): Indicates whether the GPU type is offered in this zone.
+            zone_machine_types (Set[str]): Configured machine types offered in this zone.
 
         Returns:
-            (bool, Dict[str, str]):
-                - bool: Whether a VM was successfully allocated in this zone.
-                - Dict[str, str]: Dictionary of allocation details.
+            Dict[str, str]: Dictionary of availability details for the zone.
         """
-        found_gpu = False
-        gpu_allocated = False
+        start = time.time()
         machine_type = None
-        instance_name = None
-        external_ip = None
-        gpu_reason = "UNAVAILABLE"
-
-        if gpu_available:
-            machine_type = self.is_machine_available(zone.name, machine_types_client)
-            found_gpu = machine_type is not None
-
-        if found_gpu:
-            current_timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-            instance_name = f"{self.vm_name}-{current_timestamp}"
-            vm_dict = self.create_single_vm(region, zone.name, instance_name, machine_type)
-
-            if vm_dict["gpu_reason"] == "SUCCESS":
-                vm_instance = self.start_vm_instance(zone.name, instance_name)
-                gpu_allocated = vm_instance is not None
-                gpu_reason = "SUCCESS"
-                external_ip = self.get_vm_external_ip(self.project_id, zone.name, instance_name)
-            else:
-                gpu_reason = vm_dict["gpu_reason"]
-
-        return (
-            gpu_allocated,
-            {
-                "region": "-".join(zone.name.split("-")[:-1]),
-                "zone": zone.name,
-                "instance_name": instance_name,
-                "gpu_type": self.gpu_type,
-                "machine_type": machine_type,
-                "is_available": found_gpu,
-                "gpu_allocated": gpu_allocated,
-                "gpu_reason": gpu_reason,
-                "external_ip": external_ip,
-            },
+
+        if gpu_offered and self.is_gpu_available(zone_name, region):
+            machine_type = self.is_machine_available(zone_name, region, zone_machine_types)
+        found_gpu = machine_type is not None
+
+        return {
+            "region": region,
+            "zone": zone_name,
+            "instance_name": None,
+            "gpu_type": self.gpu_type,
+            "machine_type": machine_type,
+            "is_available": found_gpu,
+            "gpu_allocated": False,
+            "gpu_reason": "AVAILABLE" if found_gpu else "UNAVAILABLE",
+            "external_ip": None,
+            "quota_headroom": self.get_quota_headroom(region) if found_gpu else 0,
+            "time_to_complete_sec": round(time.time() - start, 3),
+        }
+
+    def _create_in_zone(
+        self, zone_results: Dict[str, str], abort: Optional[threading.Event] = None
+    ) -> bool:
+        """
+        Create a VM in a zone previously found available by _probe_zone. Updates
+        the zone's allocation details in place.
+
+        Args:
+            zone_results (Dict[str, str]): Availability details returned by _probe_zone, with
+                'instance_name' set to the name of the VM to create. 'inserted' is set to
+                whether the VM may exist, as returned by create_single_vm.
+            abort (Optional[threading.Event]): Passed on to create_single_vm.
+
+        Returns:
+            bool: Whether a VM was successfully allocated in this zone.
+        """
+        start = time.time()
+        zone_name = zone_results["zone"]
+        vm_dict = self.create_single_vm(
+            zone_results["region"],
+            zone_name,
+            zone_results["instance_name"],
+            zone_results["machine_type"],
+            abort,
         )
 
-    def scan_zones(self) -> List[Dict]:
+        zone_results["gpu_reason"] = vm_dict["gpu_reason"]
+        zone_results["inserted"] = vm_dict["inserted"]
+        # Inserted VMs boot on their own, so no separate start is needed
+        zone_results["gpu_allocated"] = vm_dict["gpu_reason"] == "SUCCESS"
+
+        # All zones in a region share its quota, which a new VM or a quota failure changes
+        if zone_results["gpu_allocated"] or zone_results["gpu_reason"] == "QUOTA":
+            self._invalidate_region(zone_results["region"])
+        elif zone_results["gpu_reason"] != "CANCELLED":
+            self._invalidate_zone(zone_name)
+
+        zone_results["time_to_complete_sec"] += round(time.time() - start, 3)
+        return zone_results["gpu_allocated"]
+
+    def _create_in_zones(self, batch: List[Dict]) -> Optional[Dict]:
         """
-        Scan all zones for GPU + machine availability. If a suitable GPU is found,
-        this method creates a VM and stops further scanning.
+        Attempt VM creation in several zones at once and keep the first VM to come up.
+        The other attempts then skip their insert, or stop waiting on it if already sent, and
+        every other VM that may exist (surplus, abandoned, timed out, or failed while polling)
+        is deleted without waiting for the deletes to finish.
+
+        Args:
+            batch (List[Dict]): Availability details returned by _probe_zone for each zone.
 
         Returns:
-            List[Dict]: A list of dictionaries with allocation details for each zone checked.
+            Optional[Dict]: Allocation details of the winning zone, or None if all failed.
         """
-        scanned_zones = []
-        zones = list(compute_v1.ZonesClient().list(project=self.project_id))
-        accelerator_client = compute_v1.AcceleratorTypesClient()
-        machine_types_client = compute_v1.MachineTypesClient()
+        current_timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+        # Set once a VM is up; losing attempts then return within their in-flight API call
+        won = threading.Event()
+        winner = None
+        abandoned = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(batch)) as executor:
+            # Each attempt works on a copy so losing attempts never show up as allocated
+            attempts = {}
+            for zone_results in batch:
+                attempt = dict(zone_results)
+                # Zone suffix keeps names unique across concurrent attempts (63 char limit)
+                attempt["instance_name"] = f"{self.vm_name}-{current_timestamp}-{attempt['zone']}"[
+                    :63
+                ].rstrip("-")
+                attempts[executor.submit(self._create_in_zone, attempt, won)] = (
+                    zone_results,
+                    attempt,
+                )
 
-        logging.info(f"{len(zones)} total zones to check.")
+            for future in concurrent.futures.as_completed(attempts):
+                zone_results, attempt = attempts[future]
+                inserted = attempt.pop("inserted")
+                if future.result() and winner is None:
+                    won.set()
+                    zone_results.update(attempt)
+                    winner = zone_results
+                    continue
+
+                if future.result():
+                    zone_results["gpu_reason"] = "SURPLUS"
+                else:
+                    zone_results.update(attempt)
+                if inserted:
+                    abandoned.append(attempt)
+
+        if abandoned:
+            # GCE queues each delete behind its insert, so neither needs to be waited on
+            logging.info(f"Deleting {len(abandoned)} VMs from losing creation attempts.")
+            self.delete_vm_instances(abandoned, wait=False)
+
+        return winner
+
+    def _zone_cache_key(self) -> List:
+        """
+        Identify the configuration a zone cache was built for.
 
-        zones_checked = 0
-        for zone in zones:
-            start = time.time()
-            region = "-".join(zone.name.split("-")[:-1])  # e.g. us-central1
+        Returns:
+            List: Project, GPU type, GPU quota name, and machine types.
+        """
+        return [self.project_id, self.gpu_type, self.gpu_quota_name, list(self.machine_types)]
 
-            # Check for available GPUs
-            gpu_available = self.is_gpu_available(zone.name, accelerator_client)
+    def _load_zone_cache(self) -> Optional[Dict]:
+        """
+        Load the zone cache written by a previous run, if it matches this configuration and
+        its inventory is still within ZONE_INVENTORY_TTL_SEC.
 
-            # Attempt GPU allocation in this zone
-            gpu_allocated, zone_results = self.attempt_gpu_allocation(
-                region, zone, machine_types_client, gpu_available
-            )
-            zone_results["time_to_complete_sec"] = round(time.time() - start, 3)
-            scanned_zones.append(zone_results)
+        Returns:
+            Optional[Dict]: The zone cache, or None if a full scan is needed.
+        """
+        try:
+            with open(self.ZONE_CACHE_PATH, "r") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get("key") != self._zone_cache_key():
+            return None
+        if time.time() - cache.get("inventory_timestamp", 0) >= self.ZONE_INVENTORY_TTL_SEC:
+            return None
+        return cache
+
+    def _save_zone_cache(self):
+        """
+        Write the zone cache to ZONE_CACHE_PATH so the next run can reuse it.
+        """
+        if not self._zone_cache:
+            return
+        try:
+            with open(self.ZONE_CACHE_PATH, "w") as f:
+                json.dump(self._zone_cache, f)
+        except OSError as e:
+            logging.warning(f"Could not save zone cache to {self.ZONE_CACHE_PATH}: {e}")
 
-            if gpu_allocated:
-                logging.info(f"Allocated GPU in {zone.name}.")
-                return scanned_zones
+    def _invalidate_zone(self, zone_name: str):
+        """
+        Mark a zone's cached probe result as expired so the next scan re-probes it.
 
-            zones_checked += 1
-            if zones_checked % 10 == 0:
-                logging.info(f"Scanned {zones_checked} zones.")
+        Args:
+            zone_name (str): The zone to invalidate.
+        """
+        if self._zone_cache and zone_name in self._zone_cache["zones"]:
+            self._zone_cache["zones"][zone_name]["timestamp"] = 0
 
-        allocated_gpu = any(zone["gpu_allocated"] is True for zone in scanned_zones)
-        if not allocated_gpu:
-            logging.error("No available GPU/machine.")
-            sys.exit(1)
+    def _invalidate_region(self, region: str):
+        """
+        Mark the cached probe results of every zone in a region as expired, e.g. once its
+        quota has changed.
+
+        Args:
+            region (str): The region to invalidate.
+        """
+        if not self._zone_cache:
+            return
+        for zone_name, entry in self._zone_cache["zones"].items():
+            if entry["region"] == region:
+                self._invalidate_zone(zone_name)
+
+    def _refresh_zone_cache(self) -> List[Dict]:
+        """
+        Re-probe zones whose cached results expired or were invalidated, reusing the cached
+        inventory so only quotas are fetched again.
 
+        Returns:
+            List[Dict]: A list of dictionaries with availability details for each zone.
+        """
+        now = time.time()
+        zones = self._zone_cache["zones"]
+        stale = {
+            zone_name: entry
+            for zone_name, entry in zones.items()
+            if now - entry["timestamp"] >= self.ZONE_CACHE_TTL_SEC
+        }
+
+        if stale:
+            self._region_cache.clear()
+            # One region list refreshes all quotas; otherwise a single region get suffices
+            if len({entry["region"] for entry in stale.values()}) > 1:
+                self.get_viable_regions()
+            for zone_name, entry in stale.items():
+                entry["results"] = self._probe_zone(
+                    entry["region"], zone_name, entry["gpu_offered"], set(entry["machine_types"])
+                )
+                entry["timestamp"] = now
+
+        logging.info(
+            f"Reusing cached availability for {len(zones) - len(stale)} zones, "
+            f"re-probed {len(stale)}."
+        )
+        return [dict(entry["results"]) for entry in zones.values()]
+
+    def _probe_all_zones(self) -> List[Dict]:
+        """
+        Probe all zones and rebuild the zone cache. Zones in regions without quota are
+        recorded as unavailable without being checked.
+
+        Returns:
+            List[Dict]: A list of dictionaries with availability details for each zone checked.
+        """
+        # Start every scan with fresh quotas
+        self._region_cache.clear()
+
+        # Zones share their region's quotas, so drop zones in regions without headroom
+        viable_regions = self.get_viable_regions()
+        zones_request = compute_v1.ListZonesRequest(project=self.project_id)
+        zones = [
+            zone
+            for page in self._list_pages(self._zones_client.list, zones_request)
+            for zone in page.items
+        ]
+        # e.g. us-central1
+        zone_regions = {zone.name: zone.name.rsplit("-", 1)[0] for zone in zones}
+        viable_zones = {name for name, region in zone_regions.items() if region in viable_regions}
+
+        # Single aggregated requests instead of per-zone accelerator and machine type lookups
+        gpu_zones = self.get_gpu_zones()
+        machine_zones = self.get_machine_zones()
+
+        logging.info(
+            f"{len(viable_zones)}/{len(zones)} zones in regions with quota to check, "
+            f"{len(gpu_zones)} offer {self.gpu_type}."
+        )
+
+        # Quotas and inventory are already fetched, so probes are local lookups
+        scanned_zones = [
+            self._probe_zone(
+                region,
+                zone_name,
+                gpu_zones.get(zone_name, False) and zone_name in viable_zones,
+                machine_zones.get(zone_name, set()),
+            )
+            for zone_name, region in zone_regions.items()
+        ]
+
+        now = time.time()
+        self._zone_cache = {
+            "key": self._zone_cache_key(),
+            "inventory_timestamp": now,
+            "zones": {
+                zone["zone"]: {
+                    "timestamp": now,
+                    "region": zone["region"],
+                    "gpu_offered": gpu_zones.get(zone["zone"], False),
+                    "machine_types": sorted(machine_zones.get(zone["zone"], set())),
+                    "results": dict(zone),
+                }
+                for zone in scanned_zones
+            },
+        }
         return scanned_zones
 
+    def scan_zones(self) -> List[Dict]:
+        """
+        Scan all zones for GPU + machine availability (reusing cached results
+        from previous runs where still fresh), then try to create a VM in the available zones,
+        SPECULATIVE_INSERTS at a time and in descending order of quota headroom, until one
+        succeeds.
+
+        Returns:
+            List[Dict]: A list of dictionaries with allocation details for each zone checked.
+        """
+        self._zone_cache = self._load_zone_cache()
+        try:
+            return self._allocate_in_zones()
+        finally:
+            # Also runs on sys.exit, so failed attempts are remembered by the next run
+            self._save_zone_cache()
+
+    def _allocate_in_zones(self) -> List[Dict]:
+        """
+        Probe zones (or refresh the cached results) and try to create a VM in the available
+        zones, SPECULATIVE_INSERTS at a time (fewer if the project-wide GPU quota is lower) and
+        in descending order of quota headroom.
+
+        Returns:
+            List[Dict]: A list of dictionaries with allocation details for each zone checked.
+        """
+        if self._zone_cache is None:
+            scanned_zones = self._probe_all_zones()
+        else:
+            scanned_zones = self._refresh_zone_cache()
+
+        # Try zones with the most quota left first; jitter keeps concurrent allocators from
+        # all stampeding the same zone
+        candidates = [zone for zone in scanned_zones if zone["is_available"]]
+        candidates.sort(key=lambda zone: -zone["quota_headroom"] * random.uniform(0.9, 1.1))
+
+        # Concurrent inserts all count against the project-wide GPU quota, so run no more of
+        # them than it has room for, or the extra ones fail with OTHER_QUOTA
+        max_inserts = self.SPECULATIVE_INSERTS
+        global_headroom = self.get_global_gpu_headroom() if candidates else None
+        if global_headroom is not None:
+            max_inserts = max(1, min(max_inserts, int(global_headroom // self.gpu_count)))
+
+        # Regions whose own GPU/CPU quota ran out; project-wide quota failures do not count
+        exhausted_regions = set()
+        while candidates:
+            batch = []
+            while candidates and len(batch) < max_inserts:
+                zone_results = candidates.pop(0)
+                if zone_results["region"] in exhausted_regions:
+                    zone_results["gpu_reason"] = "QUOTA"
+                else:
+                    batch.append(zone_results)
+            if not batch:
+                continue
+
+            winner = self._create_in_zones(batch)
+            if winner:
+                # Only the winning VM needs its external IP, so fetch it once here
+                winner["external_ip"] = self.get_vm_external_ip(
+                    self.project_id, winner["zone"], winner["instance_name"]
+                )
+                logging.info(f"Allocated GPU in {winner['zone']}.")
+                return scanned_zones
+
+            for zone_results in batch:
+                if zone_results["gpu_reason"] == "QUOTA":
+                    exhausted_regions.add(zone_results["region"])
+
+        logging.error("No available GPU/machine.")
+        sys.exit(1)
+
     def create_vm_request(
         self, region: str, zone_name: str, instance_name: str, machine_type: str
-    ) -> compute_v1.Instance:
+    ) -> extended_operation.ExtendedOperation:
         """
-        Constructs and sends a request to create a VM instance. Waits for the operation to finish.
+        Constructs and sends a request to create a VM instance. Does not wait for the operation
+        to finish, so callers can tell an accepted insert from a rejected one. The created
+        instance is not fetched; use get_vm_external_ip for its address.
 
         Args:
             region (str): The region derived from the zone.
@@ -287,10 +892,8 @@ class AcquireGpu:
             machine_type (str): The machine type to use.
 
         Returns:
-            compute_v1.Instance: The created instance object.
+            ExtendedOperation: The insert operation.
         """
-        instance_client = compute_v1.InstancesClient()
-
         # GPU configuration
         accelerator_config = compute_v1.AcceleratorConfig()
         accelerator_config.accelerator_count = self.gpu_count
@@ -336,11 +939,8 @@ class AcquireGpu:
         request.project = self.project_id
         request.instance_resource = instance
 
-        # Execute the create operation and wait until completion
-        operation = instance_client.insert(request=request)
-        operation.result(timeout=300)
-
-        return instance_client.get(project=self.project_id, zone=zone_name, instance=instance_name)
+        # Send the create operation; the caller waits for it to complete
+        return self._call(self._instances_client.insert, request=request, idempotent=False)
 
     def start_vm_instance(self, zone_name: str, instance_name: str) -> str:
         """
@@ -354,18 +954,46 @@ class AcquireGpu:
             str: The instance name if started successfully, otherwise None.
         """
         try:
-            instance_client = compute_v1.InstancesClient()
-            operation = instance_client.start(
-                project=self.project_id, zone=zone_name, instance=instance_name
+            operation = self._call(
+                self._instances_client.start,
+                project=self.project_id,
+                zone=zone_name,
+                instance=instance_name,
+            )
+            operation.result(
+                timeout=self.OPERATION_TIMEOUT_SEC,
+                retry=self._api_retry,
+                polling=self.OPERATION_POLLING,
             )
-            operation.result(timeout=300)
             started_vm = True
         except Exception as e:
             started_vm = False
             logging.info(f"Failed to start instance {instance_name} (error: {str(e)})")
         return instance_name if started_vm else None
 
-    def delete_vm_instances(self, instantiated_vms: List[Dict]):
+    def _delete_vm(self, zone_name: str, instance_name: str, wait: bool = True):
+        """
+        Deletes a single VM instance.
+
+        Args:
+            zone_name (str): The zone where the instance resides.
+            instance_name (str): The name of the instance to delete.
+            wait (bool): Whether to wait for the operation to finish.
+        """
+        operation = self._call(
+            self._instances_client.delete,
+            project=self.project_id,
+            zone=zone_name,
+            instance=instance_name,
+        )
+        if wait:
+            operation.result(
+                timeout=self.OPERATION_TIMEOUT_SEC,
+                retry=self._api_retry,
+                polling=self.OPERATION_POLLING,
+            )
+
+    def delete_vm_instances(self, instantiated_vms: List[Dict], wait: bool = True):
         """
         Deletes a list of VMs using their metadata from the 'instantiated_vms' list.
 
@@ -378,6 +1006,8 @@ class AcquireGpu:
                 - machine_type
                 - is_available
                 - gpu_allocated
+            wait (bool): Whether to wait for each delete operation to finish, or only for
+                GCE to accept it.
         """
         if not instantiated_vms:
             logging.info("No surplus VMs to delete")
@@ -385,22 +1015,30 @@ class AcquireGpu:
 
         total_vms = len(instantiated_vms)
 
-        for i, vm_dict in enumerate(instantiated_vms, 1):
-            instance_name = vm_dict["instance_name"]
-            zone_name = vm_dict["zone"]
-
-            try:
-                instance_client = compute_v1.InstancesClient()
-                operation = instance_client.delete(
-                    project=self.project_id, zone=zone_name, instance=instance_name
-                )
-                operation.result(timeout=300)
-                logging.info(f"\nDeleted {instance_name} from {zone_name}...")
-            except Exception as e:
-                logging.info(f"\nFailed to delete instance {instance_name} (error: {str(e)})\n")
-
-            # Log progress every time a VM is deleted
-            logging.info(f"Progress: {i}/{total_vms} VMs deleted...")
+        # Each delete blocks on its own operation, so run them side by side
+        deleted = 0
+        max_workers = min(16, total_vms)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._delete_vm, vm_dict["zone"], vm_dict["instance_name"], wait
+                ): vm_dict
+                for vm_dict in instantiated_vms
+            }
+            for future in concurrent.futures.as_completed(futures):
+                instance_name = futures[future]["instance_name"]
+                zone_name = futures[future]["zone"]
+                try:
+                    future.result()
+                    deleted += 1
+                    action = "Deleted" if wait else "Requested deletion of"
+                    logging.info(f"\n{action} {instance_name} from {zone_name}...")
+                    logging.info(f"Progress: {deleted}/{total_vms} VMs deleted...")
+                except exceptions.NotFound:
+                    # e.g. an abandoned insert that failed before its delete was sent
+                    logging.info(f"\n{instance_name} no longer exists in {zone_name}\n")
+                except Exception as e:
+                    logging.info(f"\nFailed to delete instance {instance_name} (error: {str(e)})\n")
 
         logging.info("VM deletion process completed.")
 
@@ -447,8 +1085,9 @@ class AcquireGpu:
         Returns:
             str: The external IP address if found, otherwise None.
         """
-        client = compute_v1.InstancesClient()
-        instance = client.get(project=project_id, zone=zone, instance=instance_name)
+        instance = self._call(
+            self._instances_client.get, project=project_id, zone=zone, instance=instance_name
+        )
         for interface in instance.network_interfaces:
             for access_config in interface.access_configs:
                 if access_config.name == "External NAT":
@@ -491,18 +1130,18 @@ def main() -> None:
     Main entry point for acquiring a GPU VM. Loads config, validates credentials,
     instantiates AcquireGpu, and attempts GPU allocation.
     """
-    # Configure logging
+    # Configure logging on stderr so stdout only carries the JSON output
     logging.basicConfig(
         format="%(asctime)s - %(levelname)s - %(message)s",
         level=logging.INFO,
-        handlers=[logging.StreamHandler(sys.stdout)],
+        handlers=[logging.StreamHandler(sys.stderr)],
         force=True,
     )
     logging.info("Start acquiring GPU")
 
-    # Load YAML config
+    # Load YAML config, using the libyaml-backed loader when PyYAML was built with it
     with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
     gcp_project_id = derive_project_id(config["gcp"]["project_id"])
 
@@ -533,8 +1172,9 @@ def main() -> None:
         "EXTERNAL_IP": allocated_vms[0]["external_ip"],
     }
 
-    # Print JSON output for external use (e.g., in a bash script)
-    print(json.dumps(output))
+    # Write JSON output for external use (e.g., VM=$(python create_gcp_vm_instance.py))
+    sys.stdout.write(json.dumps(output) + "\n")
+    sys.stdout.flush()
     sys.exit(0)
 
 
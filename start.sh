@@ -50,7 +50,8 @@ command_exists() {
 create_vm_instance() {
     echo -e "\n===== Acquiring a GPU from GCP =====\n"
 
-    PYTHON_OUTPUT="$(python3 create_gcp_vm_instance.py 2>&1)"
+    # Logs stream to the terminal on stderr; only the JSON output is captured
+    PYTHON_OUTPUT="$(python3 create_gcp_vm_instance.py)"
     PYTHON_EXIT_CODE=$?
     if [[ $PYTHON_EXIT_CODE -ne 0 ]]; then
         echo -e "\n===== Error: 'create_gcp_vm_instance.py' failed with exit code $PYTHON_EXIT_CODE. ====="
@@ -60,7 +61,7 @@ create_vm_instance() {
         echo "$PYTHON_OUTPUT"
     fi
 
-    # Expect the final line of output to be JSON
+    # Expect the final line of stdout to be JSON
     OUTPUT="$(tail -n 1 <<<"$PYTHON_OUTPUT")"
 
     # Validate that OUTPUT is valid JSON